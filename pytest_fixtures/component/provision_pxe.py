@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import ipaddress
 import os
 import re
@@ -13,6 +14,16 @@ from robottelo import constants
 from robottelo.config import settings
 from robottelo.hosts import ContentHost
 
+FDI_NAME_PATTERN = re.compile(r"foreman-discovery-image\S+")
+
+PXE_LOADER_MAP = {
+    'bios': {'vm_firmware': 'bios', 'pxe_loader': 'PXELinux BIOS'},
+    'uefi': {'vm_firmware': 'uefi', 'pxe_loader': 'Grub2 UEFI'},
+    'ipxe': {'vm_firmware': 'bios', 'pxe_loader': 'iPXE Embedded'},
+    'http_uefi': {'vm_firmware': 'uefi', 'pxe_loader': 'Grub2 UEFI HTTP'},
+    'secureboot': {'vm_firmware': 'uefi_secureboot', 'pxe_loader': 'Grub2 UEFI SecureBoot'},
+}
+
 
 @pytest.fixture(scope='module')
 def module_provisioning_capsule(module_target_sat, module_location):
@@ -41,9 +52,7 @@ def module_provisioning_rhel_content(
     else:
         repo_names.append(f'rhel{rhel_ver}_bos')
         repo_names.append(f'rhel{rhel_ver}_aps')
-    rh_repos = []
     tasks = []
-    rh_repo_id = ""
     content_view = sat.api.ContentView(organization=module_sca_manifest_org).create()
 
     # Custom Content for Client repo
@@ -58,44 +67,55 @@ def module_provisioning_rhel_content(
     ).create()
     task = client_repo.sync(synchronous=False)
     tasks.append(task)
-    content_view.repository = [client_repo]
 
+    enable_kwargs = []
     for name in repo_names:
-        rh_kickstart_repo_id = sat.api_factory.enable_rhrepo_and_fetchid(
-            basearch=constants.DEFAULT_ARCHITECTURE,
-            org_id=module_sca_manifest_org.id,
-            product=constants.REPOS['kickstart'][name]['product'],
-            repo=constants.REPOS['kickstart'][name]['name'],
-            reposet=constants.REPOS['kickstart'][name]['reposet'],
-            releasever=constants.REPOS['kickstart'][name]['version'],
+        enable_kwargs.append(
+            {
+                'basearch': constants.DEFAULT_ARCHITECTURE,
+                'org_id': module_sca_manifest_org.id,
+                'product': constants.REPOS['kickstart'][name]['product'],
+                'repo': constants.REPOS['kickstart'][name]['name'],
+                'reposet': constants.REPOS['kickstart'][name]['reposet'],
+                'releasever': constants.REPOS['kickstart'][name]['version'],
+            }
         )
         # do not sync content repos for discovery based provisioning.
         if module_provisioning_sat.provisioning_type != 'discovery':
-            rh_repo_id = sat.api_factory.enable_rhrepo_and_fetchid(
-                basearch=constants.DEFAULT_ARCHITECTURE,
-                org_id=module_sca_manifest_org.id,
-                product=constants.REPOS[name]['product'],
-                repo=constants.REPOS[name]['name'],
-                reposet=constants.REPOS[name]['reposet'],
-                releasever=constants.REPOS[name]['releasever'],
+            enable_kwargs.append(
+                {
+                    'basearch': constants.DEFAULT_ARCHITECTURE,
+                    'org_id': module_sca_manifest_org.id,
+                    'product': constants.REPOS[name]['product'],
+                    'repo': constants.REPOS[name]['name'],
+                    'reposet': constants.REPOS[name]['reposet'],
+                    'releasever': constants.REPOS[name]['releasever'],
+                }
             )
+    # the reposets are independent, so enable them concurrently to overlap the API round trips
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(sat.api_factory.enable_rhrepo_and_fetchid, **kwargs)
+            for kwargs in enable_kwargs
+        ]
+        repo_ids = [future.result() for future in futures]
 
-        # Sync step because repo is not synced by default
-        for repo_id in [rh_kickstart_repo_id, rh_repo_id]:
-            if repo_id:
-                rh_repo = sat.api.Repository(id=repo_id).read()
-                task = rh_repo.sync(synchronous=False)
-                tasks.append(task)
-                rh_repos.append(rh_repo)
-                content_view.repository.append(rh_repo)
-                content_view.update(['repository'])
-    for task in tasks:
-        sat.wait_for_tasks(
-            search_query=(f'id = {task["id"]}'),
-            poll_timeout=2500,
-        )
-        task_status = sat.api.ForemanTask(id=task['id']).poll()
-        assert task_status['result'] == 'success'
+    # Hydrate all enabled repos with a single bulk search instead of one read per repo
+    rh_repos = sat.api.Repository().search(
+        query={'search': 'id ^ ({})'.format(','.join(str(repo_id) for repo_id in repo_ids))}
+    )
+    # keep the enablement order, the first kickstart repo is returned to the tests
+    rh_repos.sort(key=lambda repo: repo_ids.index(repo.id))
+    # Sync step because repos are not synced by default
+    tasks.extend(repo.sync(synchronous=False) for repo in rh_repos)
+    content_view.repository = [client_repo, *rh_repos]
+    content_view.update(['repository'])
+    # wait for all sync tasks with a single bulk query instead of polling them one by one
+    task_query = 'id ^ ({})'.format(','.join(str(task['id']) for task in tasks))
+    sat.wait_for_tasks(search_query=task_query, poll_timeout=2500, must_succeed=True)
+    task_statuses = sat.api.ForemanTask().search(query={'search': task_query})
+    for task_status in task_statuses:
+        assert task_status.result == 'success'
     rhel_xy = Version(
         constants.REPOS['kickstart'][f'rhel{rhel_ver}']['version']
         if rhel_ver == 7
@@ -115,9 +135,8 @@ def module_provisioning_rhel_content(
         max_tries=10,
     )
     assert task_status[0].result == 'success'
-    content_view = sat.api.ContentView(
-        organization=module_sca_manifest_org, name=content_view.name
-    ).search()[0]
+    # refresh the already known content view instead of searching for it again
+    content_view = content_view.read()
     ak = sat.api.ActivationKey(
         organization=module_sca_manifest_org,
         content_view=content_view,
@@ -163,16 +182,13 @@ def module_provisioning_sat(
     broker_data_out = Box(**broker_data_out['data_out'])
     provisioning_interface = ipaddress.ip_interface(broker_data_out.provisioning_addr_ipv4)
     provisioning_network = provisioning_interface.network
+    upstream_dns = broker_data_out.provisioning_upstream_dns
     # TODO: investigate DNS setup issue on Satellite,
     # we might need to set up Sat's DNS server as the primary one on the Sat host
     provisioning_upstream_dns_primary = (
-        broker_data_out.provisioning_upstream_dns.pop()
+        upstream_dns.pop()
     )  # There should always be at least one upstream DNS
-    provisioning_upstream_dns_secondary = (
-        broker_data_out.provisioning_upstream_dns.pop()
-        if len(broker_data_out.provisioning_upstream_dns)
-        else None
-    )
+    provisioning_upstream_dns_secondary = upstream_dns.pop() if len(upstream_dns) else None
 
     domain = sat.api.Domain(
         location=[module_location],
@@ -206,8 +222,9 @@ def module_provisioning_sat(
     return Box(sat=sat, domain=domain, subnet=subnet, provisioning_type=provisioning_type)
 
 
-@pytest.fixture(scope='module')
-def module_ssh_key_file():
+@pytest.fixture(scope='session')
+def session_ssh_key_file():
+    """Write the provisioning SSH private key to a temp file once per session"""
     _, layout = mkstemp(text=True)
     os.chmod(layout, 0o600)
     with open(layout, 'w') as ssh_key:
@@ -216,25 +233,30 @@ def module_ssh_key_file():
 
 
 @pytest.fixture
-def provisioning_host(module_ssh_key_file, pxe_loader, module_provisioning_sat):
+def provisioning_host(session_ssh_key_file, pxe_loader, module_provisioning_sat):
     """Fixture to check out blank VM"""
-    vlan_id = settings.provisioning.vlan_id
+    # resolve the provisioning settings node once instead of per attribute access
+    provisioning_settings = settings.provisioning
+    vlan_id = provisioning_settings.vlan_id
     cd_iso = (
         ""  # TODO: Make this an optional fixture parameter (update vm_firmware when adding this)
     )
     with Broker(
-        workflow=settings.provisioning.provisioning_host_workflow,
+        workflow=provisioning_settings.provisioning_host_workflow,
         host_class=ContentHost,
         target_vlan_id=vlan_id,
         target_vm_firmware=pxe_loader.vm_firmware,
         target_pxeless_image=cd_iso,
         blank=True,
         target_memory='6GiB',
-        auth=module_ssh_key_file,
+        auth=session_ssh_key_file,
     ) as prov_host:
         yield prov_host
+        # Clear the stale DHCP lease; skip the restart only when the VM was never
+        # powered on, as it could not have been leased an address then
+        if getattr(prov_host, '_powered_on', False) or not prov_host.blank:
+            assert module_provisioning_sat.sat.execute('systemctl restart dhcpd').status == 0
         # Set host as non-blank to run teardown of the host
-        assert module_provisioning_sat.sat.execute('systemctl restart dhcpd').status == 0
         prov_host.blank = getattr(prov_host, 'blank', False)
 
 
@@ -283,13 +305,6 @@ def provisioning_hostgroup(
 @pytest.fixture
 def pxe_loader(request):
     """Map the appropriate PXE loader to VM bootloader"""
-    PXE_LOADER_MAP = {
-        'bios': {'vm_firmware': 'bios', 'pxe_loader': 'PXELinux BIOS'},
-        'uefi': {'vm_firmware': 'uefi', 'pxe_loader': 'Grub2 UEFI'},
-        'ipxe': {'vm_firmware': 'bios', 'pxe_loader': 'iPXE Embedded'},
-        'http_uefi': {'vm_firmware': 'uefi', 'pxe_loader': 'Grub2 UEFI HTTP'},
-        'secureboot': {'vm_firmware': 'uefi_secureboot', 'pxe_loader': 'Grub2 UEFI SecureBoot'},
-    }
     return Box(PXE_LOADER_MAP[getattr(request, 'param', 'uefi')])
 
 
@@ -305,15 +320,15 @@ def pxeless_discovery_host(provisioning_host, module_discovery_sat, pxe_loader):
         f'discovery-remaster {module_discovery_sat.iso} '
         f'"proxy.type=foreman proxy.url=https://{sat.hostname}:443 fdi.pxmac={mac} fdi.pxauto=1"'
     )
-    pattern = re.compile(r"foreman-discovery-image\S+")
-    fdi = pattern.findall(result.stdout)[0]
+    fdi = FDI_NAME_PATTERN.findall(result.stdout)[0]
     Broker(
         workflow='import-disk-image',
         import_disk_image_name=image_name,
         import_disk_image_url=(f'https://{sat.hostname}/pub/{fdi}'),
         firmware_type=pxe_loader.vm_firmware,
     ).execute()
-    # Change host to boot discovery image
+    # Change host to boot discovery image; this must run after the import-disk-image
+    # workflow above since it attaches the image that the workflow imports
     Broker(
         job_template='configure-pxe-boot',
         target_host=provisioning_host.name,
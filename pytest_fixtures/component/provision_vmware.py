@@ -113,7 +113,7 @@ def module_vmware_image(
 
 
 @pytest.fixture
-def provisioning_vmware_host(pxe_loader, vmwareclient, module_ssh_key_file):
+def provisioning_vmware_host(pxe_loader, vmwareclient, session_ssh_key_file):
     """Fixture to check out blank VM on VMware"""
     vm_boot_firmware = 'efi' if pxe_loader.vm_firmware.startswith('uefi') else 'bios'
     vm_secure_boot = 'true' if pxe_loader.vm_firmware == 'uefi_secureboot' else 'false'
@@ -124,7 +124,7 @@ def provisioning_vmware_host(pxe_loader, vmwareclient, module_ssh_key_file):
         vm_network=vlan_id,
         vm_boot_firmware=vm_boot_firmware,
         vm_secure_boot=vm_secure_boot,
-        auth=module_ssh_key_file,
+        auth=session_ssh_key_file,
         blank=True,
         _skip_context_checkin=True,
     ) as provisioning_host:
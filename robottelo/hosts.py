@@ -392,6 +392,9 @@ class ContentHost(Host, ContentHostMixins):
             .lower()
             == 'successful'
         )
+        if state in [VmState.RUNNING, 'reboot']:
+            # remember the VM was started so fixtures can tell it may hold a DHCP lease
+            self._powered_on = True
 
         if ensure and state in [VmState.RUNNING, 'reboot']:
             try:
@@ -1513,7 +1516,7 @@ class Capsule(ContentHost, CapsuleMixins):
     def nailgun_capsule(self):
         return self.satellite.api.Capsule().search(query={'search': f'name={self.hostname}'})[0]
 
-    @property
+    @cached_property
     def nailgun_smart_proxy(self):
         return self.satellite.api.SmartProxy().search(query={'search': f'name={self.hostname}'})[0]
 
@@ -1,6 +1,8 @@
 # General utility functions which does not fit into other util modules OR
 # Independent utility functions that doesnt need separate module
 import base64
+from functools import lru_cache
+from pathlib import Path
 import re
 
 from cryptography.hazmat.backends import default_backend as crypto_default_backend
@@ -66,3 +68,14 @@ def parse_comma_separated_list(option_value):
             return False
         return [item.strip() for item in option_value.split(',')]
     return None
+
+
+@lru_cache(maxsize=32)
+def read_data_file(path):
+    """Return the text contents of a data file, cached per path so repeated
+    (e.g. parametrized) test invocations do not re-read it from disk.
+
+    :param path: Path to the data file, e.g. one of the ``DataFile`` constants.
+    :return: String content of the file.
+    """
+    return Path(path).read_text()
@@ -12,22 +12,28 @@
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from robottelo.constants import DataFile
+from robottelo.utils import read_data_file
 from robottelo.utils.datafactory import gen_string
 
 
 @pytest.fixture(scope='module')
 def template_data():
-    return DataFile.OS_TEMPLATE_DATA_FILE.read_text()
+    return read_data_file(DataFile.OS_TEMPLATE_DATA_FILE)
 
 
 @pytest.fixture
 def clone_setup(target_sat, module_org, module_location):
     name = gen_string('alpha')
     content = gen_string('alpha')
-    os_list = [target_sat.api.OperatingSystem().create().title for _ in range(2)]
+    # the operating systems are independent, so create them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(target_sat.api.OperatingSystem().create) for _ in range(2)]
+        os_list = [future.result().title for future in futures]
     return {
         'pt': target_sat.api.ProvisioningTemplate(
             name=name,